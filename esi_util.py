@@ -1,17 +1,43 @@
+import os
+import re
 import sys
-import datetime
 import json
+import functools
 from pathlib import Path
-import dateutil.relativedelta
-import fire
-import pygal
+import numpy as np
 import pandas as pd
-from terminaltables import SingleTable
+
+
+# ANSI escape sequences (colours, bold) take up no room on the screen.
+_ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _excel_col_to_idx(col):
+    """Converts an Excel column name (e.g. 'FO') to a zero-based index."""
+    idx = 0
+    for char in col:
+        idx = idx * 26 + ord(char.upper()) - ord('A') + 1
+
+    return idx - 1
+
+
+def _excel_range_to_idx(cols):
+    """Converts Excel column ranges (e.g. 'A,C:H') to a list of zero-based
+    column indices.
+    """
+    indices = []
+    for part in cols.split(','):
+        first, _, last = part.partition(':')
+        start = _excel_col_to_idx(first)
+        end = _excel_col_to_idx(last or first)
+        indices.extend(range(start, end + 1))
+
+    return indices
 
 
 class ESIDataWrapper:
     """Convenience class for the background work related to the ESI xlsx."""
-    ENTITY_CODES = [
+    ENTITY_CODES = (
         'eu',
         'ea',
         'at',
@@ -28,7 +54,7 @@ class ESIDataWrapper:
         'fi',
         'se',
         'uk'
-    ]
+    )
     # Two digit country/entity codes (as used in the ESI) mapped to
     # countries/entities.
     ESI_ENTITIES = {
@@ -68,34 +94,68 @@ class ESIDataWrapper:
         se='A,HS:HX',
         uk='A,IA:IF'
     )
-    # These are used in the ESI xlsx as column headers.
-    ESI_COMPONENTS = [
+    # Positional indices of each entity's columns in the parsed ESI sheet.
+    # Column A holds the dates and becomes the sheet's index, which shifts
+    # the remaining columns by one.
+    ENTITY_COL_IDX = {
+        ec: np.array([i - 1 for i in _excel_range_to_idx(cols) if i > 0])
+        for ec, cols in ENTITY_COLS.items()
+    }
+    # These are used in the ESI xlsx as column headers, in the order in which
+    # they appear for each entity.
+    ESI_COMPONENT_ORDER = (
         '.INDU',  # <Entity Code>.INDU
         '.SERV',  # <Entity Code>.SERV
         '.CONS',  # <Entity Code>.CONS
         '.RETA',  # <Entity Code>.RETA
         '.BUIL',  # <Entity Code>.BUIL
         '.ESI'  # <Entity Code>.ESI
-    ]
+    )
+    ESI_COMPONENTS = frozenset(ESI_COMPONENT_ORDER)
+    # ESI measurements are cached as float32. When they are read back they
+    # are rounded to this many decimal places, which removes the float32
+    # representation error (e.g. 96.6 read back as 96.5999984741211).
+    CACHE_DECIMALS = 4
 
     def __init__(self, data_dir=Path('.'),
                  esi_filename='main_indicators_nace2.xlsx',
-                 esi_sheet_name='MONTHLY'):
+                 esi_sheet_name='MONTHLY', engine='calamine'):
         self.data_dir = data_dir
         self.esi_filename = esi_filename
         self.esi_sheet_name = esi_sheet_name
+        # pandas engine used to read the ESI xlsx. 'openpyxl' can be used
+        # instead if python-calamine is not available.
+        self.engine = engine
+        # Parsed ESI measurements, see _fetch_esi_array().
+        self._esi_array_cache = None
 
     def _entity_csv_filename(self, entity_code):
-        """Constructs a path to an entity's CSV file."""
+        """Constructs a path to an entity's (legacy) CSV file."""
         return Path(self.data_dir) / '{}_esi.csv'.format(entity_code)
 
-    def _create_esi_csv_tables(self, esi_tables):
-        """Creates a CSV file for each country/entity."""
-        for code in self.ENTITY_CODES:
-            # Each value of the esi_tables dict is a Pandas DataFrame.
-            esi_tables[code].to_csv(
-                self._entity_csv_filename(code), encoding='utf-8'
-            )
+    def _cache_filename(self):
+        """Constructs a path to the Parquet file caching all ESI tables."""
+        return Path(self.data_dir) / 'esi_cache.parquet'
+
+    def _combine_esi_tables(self, esi_tables):
+        """Combines the tables of all countries/entities into a single
+        DataFrame aligned on their monthly PeriodIndex. Columns are keyed by
+        (entity code, ESI column header).
+        """
+        return pd.concat(
+            [esi_tables[ec] for ec in self.ENTITY_CODES],
+            axis=1,
+            keys=self.ENTITY_CODES
+        )
+
+    def _create_esi_parquet_cache(self, combined):
+        """Creates a single Parquet file holding the combined ESI tables
+        (as float32). Their monthly PeriodIndex is stored as is, so it
+        doesn't need to be rebuilt on load.
+        """
+        combined.to_parquet(
+            self._cache_filename(), engine='pyarrow', compression='zstd'
+        )
 
     def _import_esi_tables_from_xlsx(self):
         """Imports the ESI numbers for each country/entity we're interested
@@ -106,14 +166,15 @@ class ESIDataWrapper:
         # This will hold a DataFrame for each country's/entity's ESI numbers.
         esi_tables = {}
 
-        for entity, cols in self.ENTITY_COLS.items():
-            esi_tables[entity] = pd.read_excel(
-                esi_file_path,
-                sheet_name=self.esi_sheet_name,
-                header=0,
-                index_col=0,
-                usecols=cols
-            )
+        # Parse the whole sheet once and slice out each entity's columns,
+        # rather than re-reading the workbook for every entity.
+        with pd.ExcelFile(esi_file_path, engine=self.engine) as xl:
+            esi_sheet = xl.parse(self.esi_sheet_name, header=0, index_col=0)
+        # Convert date indices to monthly frequency.
+        esi_sheet.index = esi_sheet.index.to_period(freq='M')
+
+        for entity, cols_idx in self.ENTITY_COL_IDX.items():
+            esi_tables[entity] = esi_sheet.iloc[:, cols_idx]
 
         return esi_tables
 
@@ -123,32 +184,68 @@ class ESIDataWrapper:
             esi_tables[ec] = pd.read_csv(
                 self._entity_csv_filename(ec), index_col=0, parse_dates=[0]
             )
+            esi_tables[ec].index = esi_tables[ec].index.to_period(freq='M')
 
         return esi_tables
 
-    def _fetch_esi_tables(self):
-        """Returns a dict where each key is an entity code and its
-        corresponding value is a pandas DataFrame with the ESI measurements
-        for this entity.
+    def _load_esi_cache_from_parquet(self):
+        return pd.read_parquet(self._cache_filename(), engine='pyarrow')
+
+    def _have_csv_files(self):
+        """Checks whether a (legacy) CSV file exists for every
+        country/entity.
         """
-        # Check if we have CSV files for the ESI tables.
-        we_have_csvs = True
-        for ec in self.ENTITY_CODES:
-            if not Path(self._entity_csv_filename(ec)).is_file():
-                we_have_csvs = False
-                break
+        # List the data directory once instead of stat-ing every file.
+        try:
+            with os.scandir(self.data_dir) as entries:
+                filenames = {e.name for e in entries if e.is_file()}
+        except FileNotFoundError:
+            return False
+
+        return all(
+            self._entity_csv_filename(ec).name in filenames
+            for ec in self.ENTITY_CODES
+        )
 
-        if we_have_csvs:
-            esi_tables = self._load_esi_tables_from_csv()
-        else:
-            esi_tables = self._import_esi_tables_from_xlsx()
-            self._create_esi_csv_tables(esi_tables)
+    def _fetch_esi_array(self, refresh=False):
+        """Returns a (dates, values) tuple, where dates is the monthly
+        PeriodIndex of the ESI measurements and values is an array of shape
+        (dates, entities, components) holding them. Entities and components
+        follow the order of ENTITY_CODES and ESI_COMPONENT_ORDER.
 
-        # Convert date indices to monthly frequency.
-        for ec in self.ENTITY_CODES:
-            esi_tables[ec].index = esi_tables[ec].index.to_period(freq='M')
+        The measurements are cached on the instance after the first call;
+        pass refresh=True to load them again.
+        """
+        if self._esi_array_cache is not None and not refresh:
+            return self._esi_array_cache
 
-        return esi_tables
+        if self._cache_filename().is_file():
+            combined = self._load_esi_cache_from_parquet()
+        else:
+            if self._have_csv_files():
+                # Migrate the CSV files created by older versions.
+                esi_tables = self._load_esi_tables_from_csv()
+            else:
+                esi_tables = self._import_esi_tables_from_xlsx()
+            combined = self._combine_esi_tables(esi_tables).astype(np.float32)
+            self._create_esi_parquet_cache(combined)
+
+        # Each entity has one column per component, so the combined columns
+        # split evenly into an (entities, components) grid.
+        values = (
+            combined.to_numpy(dtype=np.float64)
+            .round(self.CACHE_DECIMALS)
+            .reshape(
+                len(combined.index),
+                len(self.ENTITY_CODES),
+                len(self.ESI_COMPONENT_ORDER)
+            )
+        )
+        # The array is shared by every caller of this instance.
+        values.flags.writeable = False
+        self._esi_array_cache = (combined.index, values)
+
+        return self._esi_array_cache
 
     def get_latest_rankings(self, date=None):
         """Returns a dict where keys are the ESI components and their values
@@ -191,59 +288,47 @@ class ESIDataWrapper:
                                  ('United Kingdom', -36.7)]}
         """
 
-        INDU_idx = 0  # INDU - Industrial confidence indicator (40%)
-        SERV_idx = 1  # SERV - Services confidence indicator (30%)
-        CONS_idx = 2  # CONS - Consumer confidence indicator (20%)
-        RETA_idx = 3  # RETA - Retail trade confidence indicator (5%)
-        BUIL_idx = 4  # BUIL - Construction confidence indicator (5%)
-        ESI_idx = 5  # ESI - Economic sentiment indicator, composite.
+        # Rankings in the order of ESI_COMPONENT_ORDER.
+        ranking_names = [
+            # INDU - Industrial confidence indicator (40%)
+            'industrial_confidence',
+            # SERV - Services confidence indicator (30%)
+            'services_confidence',
+            # CONS - Consumer confidence indicator (20%)
+            'consumer_confidence',
+            # RETA - Retail trade confidence indicator (5%)
+            'retail_confidence',
+            # BUIL - Construction confidence indicator (5%)
+            'construction_confidence',
+            # ESI - Economic sentiment indicator, composite.
+            'esi'
+        ]
+
+        dates, values = self._fetch_esi_array()
 
         if date is None:
-            now = datetime.datetime.now()
-            month_ago = now + dateutil.relativedelta.relativedelta(months=-1)
-            start_date = '{}-{}'.format(month_ago.year, month_ago.month)
-            end_date = '{}-{}'.format(now.year, now.month)
+            # The last row holds the latest measurements.
+            row = -1
         else:
-            start_date = date
-            end_date = date
-
-        esi_tables = self._fetch_esi_tables()
-
-        latest_values = {}
-        for ec in self.ESI_ENTITIES.keys():
+            # fire passes e.g. --date=2019 as an int.
+            date = str(date)
             try:
-                latest_values[ec] = (
-                    esi_tables[ec][start_date:end_date]
-                    .tail(1)
-                    .values.tolist()[0]
-                )
-            except IndexError:
+                rows = dates.slice_indexer(date, date)
+                row = range(len(dates))[rows][-1]
+            except (IndexError, KeyError, TypeError, ValueError):
                 sys.exit('Date given is out of range')
 
-        industrial_ranking = {}
-        services_ranking = {}
-        consumer_ranking = {}
-        retail_ranking = {}
-        construction_ranking = {}
-        esi_ranking = {}
-        for ec, label in self.ESI_ENTITIES.items():
-            industrial_ranking[label] = latest_values[ec][INDU_idx]
-            services_ranking[label] = latest_values[ec][SERV_idx]
-            consumer_ranking[label] = latest_values[ec][CONS_idx]
-            retail_ranking[label] = latest_values[ec][RETA_idx]
-            construction_ranking[label] = latest_values[ec][BUIL_idx]
-            esi_ranking[label] = latest_values[ec][ESI_idx]
-        rankings = {
-            'industrial_confidence': industrial_ranking,
-            'services_confidence': services_ranking,
-            'consumer_confidence': consumer_ranking,
-            'retail_confidence': retail_ranking,
-            'construction_confidence': construction_ranking,
-            'esi': esi_ranking
-        }
-        for ranking, values in rankings.items():
-            rankings[ranking] = sorted(
-                values.items(), key=lambda x: x[1], reverse=True
+        # One row per country/entity, one column per ESI component.
+        latest = values[row]
+        labels = np.array([self.ESI_ENTITIES[ec] for ec in self.ENTITY_CODES])
+        # Rank all components at once, highest first. Sorting the negated
+        # values keeps ties in their original order and NaNs last.
+        order = np.argsort(-latest, axis=0, kind='stable')
+        rankings = {}
+        for i, name in enumerate(ranking_names):
+            idx = order[:, i]
+            rankings[name] = list(
+                zip(labels[idx].tolist(), latest[idx, i].tolist())
             )
 
         return rankings
@@ -252,76 +337,130 @@ class ESIDataWrapper:
         """Returns a data structure with historical values for a given ESI
         component. For example:
 
-        {'countries': {'at': [100.7,
-                              98.8,
-                              # ...
-                              87.0,
-                              89.4],
-                       'be': [94.3,
-                              93.9,
-                              # ...
-                              83.5,
-                              88.8],
-                       'de': [98.2,
-                              98.6,
-                              99.1,
-                              # ...
-                              94.3,
-                              95.5],
-                       'dk': [96.3,
-                              100.9,
-                              # ...
-                              76.2,
-                              77.7,
-                              80.6],
-                       'ea': [100.2,
-                              100.7,
-                              # ...
-                              87.5,
-                              91.1],
-                       'el': [107.8,
-                              108.1,
-                              # ...
-                              90.7,
-                              89.5],
-                       'pt': [107.1,
-                              108.2,
-                              # ...
-                              85.9,
-                              87.1],
-                       'se': [95.8,
-                              95.0,
-                              # ...
-                              88.9,
-                              94.3],
-                       'uk': [88.9,
-                              89.7,
-                              # ...
-                              75.1,
-                              83.0]},
-         'dates': [Period('2019-10', 'M'),
-                   Period('2019-11', 'M'),
-                   # ...
-                   Period('2020-08', 'M'),
-                   Period('2020-09', 'M')]}
+        {'countries': {'at': array([100.7,
+                                    98.8,
+                                    # ...
+                                    87.0,
+                                    89.4]),
+                       'be': array([94.3,
+                                    93.9,
+                                    # ...
+                                    83.5,
+                                    88.8]),
+                       'de': array([98.2,
+                                    98.6,
+                                    99.1,
+                                    # ...
+                                    94.3,
+                                    95.5]),
+                       'dk': array([96.3,
+                                    100.9,
+                                    # ...
+                                    76.2,
+                                    77.7,
+                                    80.6]),
+                       'ea': array([100.2,
+                                    100.7,
+                                    # ...
+                                    87.5,
+                                    91.1]),
+                       'el': array([107.8,
+                                    108.1,
+                                    # ...
+                                    90.7,
+                                    89.5]),
+                       'pt': array([107.1,
+                                    108.2,
+                                    # ...
+                                    85.9,
+                                    87.1]),
+                       'se': array([95.8,
+                                    95.0,
+                                    # ...
+                                    88.9,
+                                    94.3]),
+                       'uk': array([88.9,
+                                    89.7,
+                                    # ...
+                                    75.1,
+                                    83.0])},
+         'dates': PeriodIndex(['2019-10',
+                               '2019-11',
+                               # ...
+                               '2020-08',
+                               '2020-09'],
+                              dtype='period[M]')}
         """
         if esi_component not in self.ESI_COMPONENTS:
             esi_component = '.ESI'
-        esi_tables = self._fetch_esi_tables()
-
-        values = {'countries': {}, 'dates': []}
-        for ec in self.ENTITY_CODES:
-            col = '{}{}'.format(ec.upper(), esi_component)
-            values['countries'][ec] = esi_tables[ec][col].tail(months).tolist()
-        values['dates'] = (
-            esi_tables[self.ENTITY_CODES[0]].tail(months).index.tolist()
-        )
+        dates, esi_values = self._fetch_esi_array()
+        component_idx = self.ESI_COMPONENT_ORDER.index(esi_component)
+        start = max(len(dates) - months, 0)
+
+        values = {'countries': {}, 'dates': dates[start:]}
+        for i, ec in enumerate(self.ENTITY_CODES):
+            values['countries'][ec] = (
+                esi_values[start:, i, component_idx].copy()
+            )
 
         return values
 
 
+def _visible_len(text):
+    """Returns the length of a string as displayed in the console."""
+    return len(_ANSI_ESCAPE_RE.sub('', text))
+
+
+def _render_table(rows, title=None):
+    """Renders a box-drawn console table. The first row holds the headers.
+    The title, if given and if it fits, is placed on the top border.
+    """
+    widths = [
+        max(_visible_len(cell) for cell in column) for column in zip(*rows)
+    ]
+
+    def border(left, middle, right):
+        return left + middle.join('─' * (w + 2) for w in widths) + right
+
+    def line(row):
+        cells = [
+            cell + ' ' * (w - _visible_len(cell))
+            for cell, w in zip(row, widths)
+        ]
+        return '│ ' + ' │ '.join(cells) + ' │'
+
+    top = border('┌', '┬', '┐')
+    if title and len(title) < len(top) - 2:
+        top = top[0] + title + top[len(title) + 1:]
+    lines = [top, line(rows[0]), border('├', '┼', '┤')]
+    lines.extend(line(row) for row in rows[1:])
+    lines.append(border('└', '┴', '┘'))
+
+    return '\n'.join(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def _esi_data_wrapper(data_dir=None, esi_filename=None, esi_sheet_name=None,
+                      engine=None):
+    """Returns an ESIDataWrapper for the given settings. Wrappers are shared
+    so that the ESI tables are only parsed once per process.
+    """
+    esi = ESIDataWrapper()
+    if data_dir:
+        esi.data_dir = data_dir
+    if esi_filename:
+        esi.esi_filename = esi_filename
+    if esi_sheet_name:
+        esi.esi_sheet_name = esi_sheet_name
+    if engine:
+        esi.engine = engine
+
+    return esi
+
+
 def display_latest_rankings(date=None, json_output=False, data_dir=None,
-                            esi_filename=None, esi_sheet_name=None):
+                            esi_filename=None, esi_sheet_name=None,
+                            engine=None):
     """Display ESI rankings in the console or output as JSON."""
     BOLD = '\033[1m'
     ENDC = '\033[0m'
@@ -335,70 +474,50 @@ def display_latest_rankings(date=None, json_output=False, data_dir=None,
         'retail_confidence',
         'construction_confidence'
     ]
-    esi = ESIDataWrapper()
-    if data_dir:
-        esi.data_dir = data_dir
-    if esi_filename:
-        esi.esi_filename = esi_filename
-    if esi_sheet_name:
-        esi.esi_sheet_name = esi_sheet_name
-    num_entries = len(esi.ESI_ENTITIES)
+    esi = _esi_data_wrapper(data_dir, esi_filename, esi_sheet_name, engine)
     rankings = esi.get_latest_rankings(date=date)
 
     if json_output:
         print(json.dumps(rankings))
     else:
-        table_data = [
-            # Headers.
-            [
-                BOLD + 'ESI' + ENDC,
-                'Industrial Confidence (40%)',
-                'Services Confidence (30%)',
-                'Consumer Confidence (20%)',
-                'Retail Trade Confidence (5%)',
-                'Construction Confidence (5%)'
-            ]
+        headers = [
+            BOLD + 'ESI' + ENDC,
+            'Industrial Confidence (40%)',
+            'Services Confidence (30%)',
+            'Consumer Confidence (20%)',
+            'Retail Trade Confidence (5%)',
+            'Construction Confidence (5%)'
         ]
-        for i in range(num_entries):
-            if i == 0:
-                tmpl = GREEN + '{} ({})' + ENDC
-            elif i == 15:
-                tmpl = RED + '{} ({})' + ENDC
-            else:
-                tmpl = '{} ({})'
-
-            row = [
-                tmpl.format(
-                    rankings[indicator][i][0], rankings[indicator][i][1]
-                )
-                for indicator in indicators
+        columns = []
+        for indicator in indicators:
+            cells = [
+                '{} ({})'.format(label, value)
+                for label, value in rankings[indicator]
             ]
-            table_data.append(row)
+            # Highlight the top and the bottom of each ranking.
+            cells[0] = GREEN + cells[0] + ENDC
+            cells[-1] = RED + cells[-1] + ENDC
+            columns.append(cells)
+        table_data = [headers] + [list(row) for row in zip(*columns)]
 
-        rankings_table = SingleTable(table_data)
-        rankings_table.inner_heading_row_border = False
-        rankings_table.inner_heading_row_border = True
+        title = None
         if date:
-            rankings_table.title = 'Rankings for {}'.format(date)
+            title = 'Rankings for {}'.format(date)
 
-        print(rankings_table.table)
+        print(_render_table(table_data, title=title))
 
 
 def historical_esi_values_chart(esi_component, title, filename=None,
                                 months=12, data_dir=None, esi_filename=None,
-                                esi_sheet_name=None):
+                                esi_sheet_name=None, engine=None):
     """Generates an SVG chart with historical values for an ESI component."""
+    import pygal
+
     disable_xml_declaration = True
     if filename is not None:
         disable_xml_declaration = False
     title = 'ESI - {} (past {} months)'.format(title, months)
-    esi = ESIDataWrapper()
-    if data_dir:
-        esi.data_dir = data_dir
-    if esi_filename:
-        esi.esi_filename = esi_filename
-    if esi_sheet_name:
-        esi.esi_sheet_name = esi_sheet_name
+    esi = _esi_data_wrapper(data_dir, esi_filename, esi_sheet_name, engine)
     values = esi.get_historical_values(esi_component, months)
 
     chart = pygal.Line(
@@ -408,7 +527,7 @@ def historical_esi_values_chart(esi_component, title, filename=None,
         disable_xml_declaration=disable_xml_declaration
     )
     chart.title = title
-    chart.x_labels = map(lambda d: d.strftime('%Y-%m'), values['dates'])
+    chart.x_labels = values['dates'].strftime('%Y-%m').tolist()
     for country, val in values['countries'].items():
         chart.add(country, val)
 
@@ -418,102 +537,71 @@ def historical_esi_values_chart(esi_component, title, filename=None,
         return chart.render()
 
 
-# Convenience functions.
-
-
-def industrial_esi_chart(filename=None, months=12, data_dir=None,
-                         esi_filename=None, esi_sheet_name=None):
-    """Render an SVG chart with ESI Industrial Confidence data."""
-    return historical_esi_values_chart(
+# Chart commands: the ESI component, chart title and description for each
+# of them.
+_CHART_SPECS = {
+    'industrial_chart': (
         '.INDU',
         'Industrial Confidence',
-        filename=filename,
-        months=months,
-        data_dir=data_dir,
-        esi_filename=esi_filename,
-        esi_sheet_name=esi_sheet_name
-    )
-
-
-def services_esi_chart(filename=None, months=12, data_dir=None,
-                       esi_filename=None, esi_sheet_name=None):
-    """Render an SVG chart with ESI Services Confidence data."""
-    return historical_esi_values_chart(
+        'Render an SVG chart with ESI Industrial Confidence data.'
+    ),
+    'services_chart': (
         '.SERV',
         'Services Confidence',
-        filename=filename,
-        months=months,
-        data_dir=data_dir,
-        esi_filename=esi_filename,
-        esi_sheet_name=esi_sheet_name
-    )
-
-
-def consumer_esi_chart(filename=None, months=12, data_dir=None,
-                       esi_filename=None, esi_sheet_name=None):
-    """Render an SVG chart with ESI Consumer Confidence data."""
-    return historical_esi_values_chart(
+        'Render an SVG chart with ESI Services Confidence data.'
+    ),
+    'consumer_chart': (
         '.CONS',
         'Consumer Confidence',
-        filename=filename,
-        months=months,
-        data_dir=data_dir,
-        esi_filename=esi_filename,
-        esi_sheet_name=esi_sheet_name
-    )
-
-
-def retail_trade_esi_chart(filename=None, months=12, data_dir=None,
-                           esi_filename=None, esi_sheet_name=None):
-    """Render an SVG chart with ESI Retail Trade Confidence data."""
-    return historical_esi_values_chart(
+        'Render an SVG chart with ESI Consumer Confidence data.'
+    ),
+    'retail_trade_chart': (
         '.RETA',
         'Retail Trade Confidence',
-        filename=filename,
-        months=months,
-        data_dir=data_dir,
-        esi_filename=esi_filename,
-        esi_sheet_name=esi_sheet_name
-    )
-
-
-def construction_esi_chart(filename=None, months=12, data_dir=None,
-                           esi_filename=None, esi_sheet_name=None):
-    """Render an SVG chart with ESI Construction Confidence data."""
-    return historical_esi_values_chart(
+        'Render an SVG chart with ESI Retail Trade Confidence data.'
+    ),
+    'construction_chart': (
         '.BUIL',
         'Construction Confidence',
-        filename=filename,
-        months=months,
-        data_dir=data_dir,
-        esi_filename=esi_filename,
-        esi_sheet_name=esi_sheet_name
-    )
-
-
-def esi_chart(filename=None, months=12, data_dir=None, esi_filename=None,
-              esi_sheet_name=None):
-    """Render an SVG chart with ESI data."""
-    return historical_esi_values_chart(
+        'Render an SVG chart with ESI Construction Confidence data.'
+    ),
+    'esi_chart': (
         '.ESI',
         'ESI',
-        filename=filename,
-        months=months,
-        data_dir=data_dir,
-        esi_filename=esi_filename,
-        esi_sheet_name=esi_sheet_name
+        'Render an SVG chart with ESI data.'
     )
+}
+
+
+def _chart_command(name, esi_component, title, description):
+    """Returns a chart command rendering historical values for an ESI
+    component.
+    """
+    def command(filename=None, months=12, data_dir=None, esi_filename=None,
+                esi_sheet_name=None, engine=None):
+        return historical_esi_values_chart(
+            esi_component,
+            title,
+            filename=filename,
+            months=months,
+            data_dir=data_dir,
+            esi_filename=esi_filename,
+            esi_sheet_name=esi_sheet_name,
+            engine=engine
+        )
+
+    command.__name__ = command.__qualname__ = name
+    command.__doc__ = description
+
+    return command
+
+
+CHART_COMMANDS = {
+    name: _chart_command(name, *spec) for name, spec in _CHART_SPECS.items()
+}
 
 
 if __name__ == '__main__':
-    fire.Fire(
-        {
-            'latest_rankings': display_latest_rankings,
-            'industrial_chart': industrial_esi_chart,
-            'services_chart': services_esi_chart,
-            'consumer_chart': consumer_esi_chart,
-            'retail_trade_chart': retail_trade_esi_chart,
-            'construction_chart': construction_esi_chart,
-            'esi_chart': esi_chart
-        }
-    )
+    import fire
+
+    fire.Fire({'latest_rankings': display_latest_rankings, **CHART_COMMANDS})